@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hmac
 import logging
 import platform
 import secrets
@@ -13,6 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 
 try:
     from bleak import BleakClient, BleakScanner, BLEDevice  # type: ignore
+    from bleak.exc import BleakError  # type: ignore
 except ImportError:
     _LOGGER.error("Please install 'rivian-python-client[ble]' to use BLE features.")
     raise
@@ -26,31 +28,58 @@ PHONE_NONCE_VEHICLE_NONCE_UUID = "E020A15D-E730-4B2C-908B-51DAF9D41E19"
 
 CONNECT_TIMEOUT = 10.0
 NOTIFICATION_TIMEOUT = 3.0
+NOTIFICATION_QUEUE_SIZE = 16
 
 
 class BleNotificationResponse:
     """BLE notification response helper."""
 
-    def __init__(self) -> None:
+    def __init__(self, disconnected: asyncio.Event | None = None) -> None:
         """Initialize the BLE notification response helper."""
-        self.data: bytes | None = None
-        self.event = asyncio.Event()
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(NOTIFICATION_QUEUE_SIZE)
+        self._disconnected = disconnected
 
     def notification_handler(self, _, notification_data: bytearray) -> None:
         """Notification handler."""
-        self.data = notification_data
-        self.event.set()
-
-    async def wait(self, timeout: float | None = NOTIFICATION_TIMEOUT) -> bool:
-        """Wait for the notification response."""
-        return await asyncio.wait_for(self.event.wait(), timeout)
+        if self.queue.full():
+            _LOGGER.debug("Notification queue full, dropping oldest notification")
+            self.queue.get_nowait()
+        self.queue.put_nowait(bytes(notification_data))
+
+    async def next(self, timeout: float | None = NOTIFICATION_TIMEOUT) -> bytes:
+        """Wait for and return the next notification.
+
+        Raises `BleakError` right away if the device disconnects while waiting.
+        """
+        if self._disconnected is None:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+
+        notification = asyncio.ensure_future(self.queue.get())
+        disconnected = asyncio.ensure_future(self._disconnected.wait())
+        try:
+            await asyncio.wait(
+                (notification, disconnected),
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            notification.cancel()
+            disconnected.cancel()
+            await asyncio.wait((notification, disconnected))
+        if not notification.cancelled():
+            return notification.result()
+        if not disconnected.cancelled():
+            raise BleakError("Device disconnected while waiting for notification")
+        raise asyncio.TimeoutError
 
 
 async def create_notification_handler(
-    client: BleakClient, char_specifier: str
+    client: BleakClient,
+    char_specifier: str,
+    disconnected: asyncio.Event | None = None,
 ) -> BleNotificationResponse:
     """Create a notification handler."""
-    response = BleNotificationResponse()
+    response = BleNotificationResponse(disconnected)
     await client.start_notify(char_specifier, response.notification_handler)
     return response
 
@@ -69,38 +98,47 @@ async def pair_phone(
     """
     _LOGGER.debug("Connecting to %s", device)
     try:
-        async with BleakClient(device, timeout=CONNECT_TIMEOUT) as client:
+        phone_id_bytes = bytes.fromhex(phone_id.replace("-", ""))
+        vehicle_id_bytes = bytes.fromhex(vas_vehicle_id.replace("-", ""))
+        disconnected = asyncio.Event()
+        async with BleakClient(
+            device,
+            disconnected_callback=lambda _: disconnected.set(),
+            timeout=CONNECT_TIMEOUT,
+        ) as client:
             _LOGGER.debug("Connected to %s", device)
-            vehicle_id_handler = await create_notification_handler(
-                client, PHONE_ID_VEHICLE_ID_UUID
-            )
-            nonce_handler = await create_notification_handler(
-                client, PHONE_NONCE_VEHICLE_NONCE_UUID
+            vehicle_id_handler, nonce_handler = await asyncio.gather(
+                create_notification_handler(
+                    client, PHONE_ID_VEHICLE_ID_UUID, disconnected
+                ),
+                create_notification_handler(
+                    client, PHONE_NONCE_VEHICLE_NONCE_UUID, disconnected
+                ),
             )
 
             _LOGGER.debug("Validating id")
             await client.write_gatt_char(
-                PHONE_ID_VEHICLE_ID_UUID, bytes.fromhex(phone_id.replace("-", ""))
+                PHONE_ID_VEHICLE_ID_UUID, phone_id_bytes, response=True
             )
-            await vehicle_id_handler.wait()
-
-            assert vehicle_id_handler.data
-            vehicle_id_response = vehicle_id_handler.data.hex()
-            if vehicle_id_response != vas_vehicle_id.replace("-", ""):
-                _LOGGER.debug(
-                    "Incorrect vehicle id: received %s, expected %s",
-                    vehicle_id_response,
-                    vas_vehicle_id,
-                )
+            vehicle_id_response = await vehicle_id_handler.next()
+            if not hmac.compare_digest(vehicle_id_response, vehicle_id_bytes):
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Incorrect vehicle id: received %s, expected %s",
+                        vehicle_id_response.hex(),
+                        vas_vehicle_id,
+                    )
                 return False
 
             _LOGGER.debug("Exchanging nonce")
             phone_nonce = secrets.token_bytes(16)
-            hmac = generate_ble_command_hmac(phone_nonce, vehicle_key, private_key)
+            signature = await asyncio.get_running_loop().run_in_executor(
+                None, generate_ble_command_hmac, phone_nonce, vehicle_key, private_key
+            )
             await client.write_gatt_char(
-                PHONE_NONCE_VEHICLE_NONCE_UUID, phone_nonce + hmac
+                PHONE_NONCE_VEHICLE_NONCE_UUID, phone_nonce + signature, response=True
             )
-            await nonce_handler.wait()
+            await nonce_handler.next()
 
             # Vehicle is authenticated, trigger bonding
             _LOGGER.debug("Attempting to pair")
@@ -128,8 +166,7 @@ async def pair_phone(
 
 async def find_phone_key() -> BLEDevice | None:
     """Find phone key."""
-    async with BleakScanner() as scanner:
-        return await scanner.find_device_by_name(DEVICE_LOCAL_NAME)
+    return await BleakScanner.find_device_by_name(DEVICE_LOCAL_NAME)
 
 
 async def set_bluez_pairable(device: BLEDevice) -> bool:
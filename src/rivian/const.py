@@ -10,173 +10,179 @@ if sys.version_info >= (3, 11):
 else:
     from backports.strenum import StrEnum
 
-LIVE_SESSION_PROPERTIES: Final[set[str]] = {
-    "chargerId",
-    "current",
-    "currentCurrency",
-    "currentMiles",
-    "currentPrice",
-    "isFreeSession",
-    "isRivianCharger",
-    "kilometersChargedPerHour",
-    "locationId",
-    "power",
-    "rangeAddedThisSession",
-    "soc",
-    "startTime",
-    "timeElapsed",
-    "timeRemaining",
-    "totalChargedEnergy",
-    "vehicleChargerState",
-}
+LIVE_SESSION_PROPERTIES: Final[frozenset[str]] = frozenset(
+    {
+        "chargerId",
+        "current",
+        "currentCurrency",
+        "currentMiles",
+        "currentPrice",
+        "isFreeSession",
+        "isRivianCharger",
+        "kilometersChargedPerHour",
+        "locationId",
+        "power",
+        "rangeAddedThisSession",
+        "soc",
+        "startTime",
+        "timeElapsed",
+        "timeRemaining",
+        "totalChargedEnergy",
+        "vehicleChargerState",
+    }
+)
 
-VEHICLE_STATE_PROPERTIES: Final[set[str]] = {
-    # VehicleCloudConnection
-    "cloudConnection",
-    # VehicleLocation
-    "geoLocation",
-    "gnssLocation",
-    "gnssError",
-    # TimeStamped(String|[Nullable]Float|Int)
-    "activeDriverName",
-    "alarmSoundStatus",
-    "batteryCapacity",
-    "batteryCellType",
-    "batteryHvThermalEvent",
-    "batteryHvThermalEventPropagation",
-    "batteryLevel",
-    "batteryLimit",
-    "batteryNeedsLfpCalibration",
-    "brakeFluidLow",
-    "btmFfHardwareFailureStatus",
-    "btmIcHardwareFailureStatus",
-    "btmLfdHardwareFailureStatus",
-    "btmOcHardwareFailureStatus",
-    "btmRfdHardwareFailureStatus",
-    "btmRfHardwareFailureStatus",
-    "cabinClimateDriverTemperature",
-    "cabinClimateInteriorTemperature",
-    "cabinPreconditioningStatus",
-    "cabinPreconditioningType",
-    "carWashMode",
-    "chargerDerateStatus",
-    "chargerState",
-    "chargerStatus",
-    "chargePortState",
-    "chargingDisabledAll",
-    "closureFrunkClosed",
-    "closureFrunkLocked",
-    "closureFrunkNextAction",
-    "closureLiftgateClosed",
-    "closureLiftgateLocked",
-    "closureLiftgateNextAction",
-    "closureSideBinLeftClosed",
-    "closureSideBinLeftLocked",
-    "closureSideBinLeftNextAction",
-    "closureSideBinRightClosed",
-    "closureSideBinRightLocked",
-    "closureSideBinRightNextAction",
-    "closureTailgateClosed",
-    "closureTailgateLocked",
-    "closureTailgateNextAction",
-    "closureTonneauClosed",
-    "closureTonneauLocked",
-    "closureTonneauNextAction",
-    "defrostDefogStatus",
-    "distanceToEmpty",
-    "doorFrontLeftClosed",
-    "doorFrontLeftLocked",
-    "doorFrontRightClosed",
-    "doorFrontRightLocked",
-    "doorRearLeftClosed",
-    "doorRearLeftLocked",
-    "doorRearRightClosed",
-    "doorRearRightLocked",
-    "driveMode",
-    "gearGuardLocked",
-    "gearGuardVideoMode",
-    "gearGuardVideoStatus",
-    "gearGuardVideoTermsAccepted",
-    "gearStatus",
-    "gnssAltitude",
-    "gnssBearing",
-    "gnssSpeed",
-    "limitedRegenCold",
-    "limitedAccelCold",
-    "otaAvailableVersion",
-    "otaAvailableVersionGitHash",
-    "otaAvailableVersionNumber",
-    "otaAvailableVersionWeek",
-    "otaAvailableVersionYear",
-    "otaCurrentStatus",
-    "otaCurrentVersion",
-    "otaCurrentVersionGitHash",
-    "otaCurrentVersionNumber",
-    "otaCurrentVersionWeek",
-    "otaCurrentVersionYear",
-    "otaDownloadProgress",
-    "otaInstallDuration",
-    "otaInstallProgress",
-    "otaInstallReady",
-    "otaInstallTime",
-    "otaInstallType",
-    "otaStatus",
-    "petModeStatus",
-    "petModeTemperatureStatus",
-    "powerState",
-    "rangeThreshold",
-    "rearHitchStatus",
-    "remoteChargingAvailable",
-    "seatFrontLeftHeat",
-    "seatFrontLeftVent",
-    "seatFrontRightHeat",
-    "seatFrontRightVent",
-    "seatRearLeftHeat",
-    "seatRearRightHeat",
-    "seatThirdRowLeftHeat",
-    "seatThirdRowRightHeat",
-    "serviceMode",
-    "steeringWheelHeat",
-    "timeToEndOfCharge",
-    "tirePressureStatusFrontLeft",
-    "tirePressureStatusFrontRight",
-    "tirePressureStatusRearLeft",
-    "tirePressureStatusRearRight",
-    "tirePressureStatusValidFrontLeft",
-    "tirePressureStatusValidFrontRight",
-    "tirePressureStatusValidRearLeft",
-    "tirePressureStatusValidRearRight",
-    "trailerStatus",
-    "twelveVoltBatteryHealth",
-    "vehicleMileage",
-    "windowFrontLeftCalibrated",
-    "windowFrontLeftClosed",
-    "windowFrontRightCalibrated",
-    "windowFrontRightClosed",
-    "windowRearLeftCalibrated",
-    "windowRearLeftClosed",
-    "windowRearRightCalibrated",
-    "windowRearRightClosed",
-    "windowsNextAction",
-    "wiperFluidState",
-}
+VEHICLE_STATE_PROPERTIES: Final[frozenset[str]] = frozenset(
+    {
+        # VehicleCloudConnection
+        "cloudConnection",
+        # VehicleLocation
+        "geoLocation",
+        "gnssLocation",
+        "gnssError",
+        # TimeStamped(String|[Nullable]Float|Int)
+        "activeDriverName",
+        "alarmSoundStatus",
+        "batteryCapacity",
+        "batteryCellType",
+        "batteryHvThermalEvent",
+        "batteryHvThermalEventPropagation",
+        "batteryLevel",
+        "batteryLimit",
+        "batteryNeedsLfpCalibration",
+        "brakeFluidLow",
+        "btmFfHardwareFailureStatus",
+        "btmIcHardwareFailureStatus",
+        "btmLfdHardwareFailureStatus",
+        "btmOcHardwareFailureStatus",
+        "btmRfdHardwareFailureStatus",
+        "btmRfHardwareFailureStatus",
+        "cabinClimateDriverTemperature",
+        "cabinClimateInteriorTemperature",
+        "cabinPreconditioningStatus",
+        "cabinPreconditioningType",
+        "carWashMode",
+        "chargerDerateStatus",
+        "chargerState",
+        "chargerStatus",
+        "chargePortState",
+        "chargingDisabledAll",
+        "closureFrunkClosed",
+        "closureFrunkLocked",
+        "closureFrunkNextAction",
+        "closureLiftgateClosed",
+        "closureLiftgateLocked",
+        "closureLiftgateNextAction",
+        "closureSideBinLeftClosed",
+        "closureSideBinLeftLocked",
+        "closureSideBinLeftNextAction",
+        "closureSideBinRightClosed",
+        "closureSideBinRightLocked",
+        "closureSideBinRightNextAction",
+        "closureTailgateClosed",
+        "closureTailgateLocked",
+        "closureTailgateNextAction",
+        "closureTonneauClosed",
+        "closureTonneauLocked",
+        "closureTonneauNextAction",
+        "defrostDefogStatus",
+        "distanceToEmpty",
+        "doorFrontLeftClosed",
+        "doorFrontLeftLocked",
+        "doorFrontRightClosed",
+        "doorFrontRightLocked",
+        "doorRearLeftClosed",
+        "doorRearLeftLocked",
+        "doorRearRightClosed",
+        "doorRearRightLocked",
+        "driveMode",
+        "gearGuardLocked",
+        "gearGuardVideoMode",
+        "gearGuardVideoStatus",
+        "gearGuardVideoTermsAccepted",
+        "gearStatus",
+        "gnssAltitude",
+        "gnssBearing",
+        "gnssSpeed",
+        "limitedRegenCold",
+        "limitedAccelCold",
+        "otaAvailableVersion",
+        "otaAvailableVersionGitHash",
+        "otaAvailableVersionNumber",
+        "otaAvailableVersionWeek",
+        "otaAvailableVersionYear",
+        "otaCurrentStatus",
+        "otaCurrentVersion",
+        "otaCurrentVersionGitHash",
+        "otaCurrentVersionNumber",
+        "otaCurrentVersionWeek",
+        "otaCurrentVersionYear",
+        "otaDownloadProgress",
+        "otaInstallDuration",
+        "otaInstallProgress",
+        "otaInstallReady",
+        "otaInstallTime",
+        "otaInstallType",
+        "otaStatus",
+        "petModeStatus",
+        "petModeTemperatureStatus",
+        "powerState",
+        "rangeThreshold",
+        "rearHitchStatus",
+        "remoteChargingAvailable",
+        "seatFrontLeftHeat",
+        "seatFrontLeftVent",
+        "seatFrontRightHeat",
+        "seatFrontRightVent",
+        "seatRearLeftHeat",
+        "seatRearRightHeat",
+        "seatThirdRowLeftHeat",
+        "seatThirdRowRightHeat",
+        "serviceMode",
+        "steeringWheelHeat",
+        "timeToEndOfCharge",
+        "tirePressureStatusFrontLeft",
+        "tirePressureStatusFrontRight",
+        "tirePressureStatusRearLeft",
+        "tirePressureStatusRearRight",
+        "tirePressureStatusValidFrontLeft",
+        "tirePressureStatusValidFrontRight",
+        "tirePressureStatusValidRearLeft",
+        "tirePressureStatusValidRearRight",
+        "trailerStatus",
+        "twelveVoltBatteryHealth",
+        "vehicleMileage",
+        "windowFrontLeftCalibrated",
+        "windowFrontLeftClosed",
+        "windowFrontRightCalibrated",
+        "windowFrontRightClosed",
+        "windowRearLeftCalibrated",
+        "windowRearLeftClosed",
+        "windowRearRightCalibrated",
+        "windowRearRightClosed",
+        "windowsNextAction",
+        "wiperFluidState",
+    }
+)
 
-VEHICLE_STATES_SUBSCRIPTION_ONLY_PROPERTIES: Final[set[str]] = {
-    # TimeStamped(String|[Nullable]Float|Int)
-    "activeDriverName",
-    "chargingDisabledACFaultState",
-    "chargingTimeEstimationValidity",
-    "chargingTripTargetSoc",
-    "chargingTripTargetMinsRemaining",
-    "closureChargePortDoorNextAction",
-    "coldRangeNotification",
-    "tirePressureFrontLeft",
-    "tirePressureFrontRight",
-    "tirePressureRearLeft",
-    "tirePressureRearRight",
-}
+VEHICLE_STATES_SUBSCRIPTION_ONLY_PROPERTIES: Final[frozenset[str]] = frozenset(
+    {
+        # TimeStamped(String|[Nullable]Float|Int)
+        "activeDriverName",
+        "chargingDisabledACFaultState",
+        "chargingTimeEstimationValidity",
+        "chargingTripTargetSoc",
+        "chargingTripTargetMinsRemaining",
+        "closureChargePortDoorNextAction",
+        "coldRangeNotification",
+        "tirePressureFrontLeft",
+        "tirePressureFrontRight",
+        "tirePressureRearLeft",
+        "tirePressureRearRight",
+    }
+)
 
-VEHICLE_STATES_SUBSCRIPTION_PROPERTIES = (
+VEHICLE_STATES_SUBSCRIPTION_PROPERTIES: Final[frozenset[str]] = (
     VEHICLE_STATE_PROPERTIES | VEHICLE_STATES_SUBSCRIPTION_ONLY_PROPERTIES
 )
 
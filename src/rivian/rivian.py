@@ -410,7 +410,7 @@ class Rivian:
         return await self.__graphql_query(headers, url, graphql_json)
 
     async def get_vehicle_state(
-        self, vin: str, properties: set[str] | None = None
+        self, vin: str, properties: set[str] | frozenset[str] | None = None
     ) -> ClientResponse:
         """Get vehicle state."""
         if not properties:
@@ -423,7 +423,7 @@ class Rivian:
                 "Subscription only properties have been identified and removed: %s",
                 ", ".join(subscription_properties),
             )
-            properties.difference_update(subscription_properties)
+            properties = properties - subscription_properties
 
         url = GRAPHQL_GATEWAY
 
@@ -463,7 +463,7 @@ class Rivian:
         return await self.__graphql_query(headers, url, graphql_json)
 
     async def get_live_charging_session(
-        self, vin: str, properties: set[str] | None = None
+        self, vin: str, properties: set[str] | frozenset[str] | None = None
     ) -> ClientResponse:
         """Get live charging session data."""
         if not properties:
@@ -597,7 +597,7 @@ class Rivian:
         self,
         vehicle_id: str,
         callback: Callable[[dict[str, Any]], None],
-        properties: set[str] | None = None,
+        properties: set[str] | frozenset[str] | None = None,
     ) -> Callable | None:
         """Open a web socket connection to receive updates."""
         if not properties:
@@ -731,7 +731,9 @@ class Rivian:
         """
         await self.close()
 
-    def _build_vehicle_state_fragment(self, properties: set[str]) -> str:
+    def _build_vehicle_state_fragment(
+        self, properties: set[str] | frozenset[str]
+    ) -> str:
         """Build GraphQL vehicle state fragment from properties."""
         frag = " ".join(
             f"{p} {TEMPLATE_MAP.get(p, VALUE_TEMPLATE)}" for p in properties
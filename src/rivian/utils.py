@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import hmac
 from base64 import b64decode, b64encode
+from functools import lru_cache
 from typing import cast
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -17,13 +18,15 @@ def base64_encode(data: bytes) -> str:
     return b64encode(data).decode("utf-8")
 
 
+@lru_cache(maxsize=8)
 def decode_private_key(private_key_str: str) -> ec.EllipticCurvePrivateKey:
     """Decode an EC private key."""
     key = serialization.load_pem_private_key(b64decode(private_key_str), password=None)
     return cast(ec.EllipticCurvePrivateKey, key)
 
 
-def decode_public_key(public_key_str) -> ec.EllipticCurvePublicKey:
+@lru_cache(maxsize=8)
+def decode_public_key(public_key_str: str) -> ec.EllipticCurvePublicKey:
     """Decode an EC public key."""
     return ec.EllipticCurvePublicKey.from_encoded_point(
         ec.SECP256R1(), bytes.fromhex(public_key_str)
@@ -0,0 +1,55 @@
+"""Test ble module."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("bleak")
+
+from bleak.exc import BleakError
+
+from rivian.ble import BleNotificationResponse
+
+
+async def test_notification_wins() -> None:
+    """Test a notification is returned before the device disconnects."""
+    disconnected = asyncio.Event()
+    response = BleNotificationResponse(disconnected)
+    loop = asyncio.get_running_loop()
+    loop.call_soon(response.notification_handler, None, bytearray(b"\x01\x02"))
+    assert await response.next(timeout=1) == b"\x01\x02"
+    assert response.queue.empty()
+
+
+async def test_disconnect_wins() -> None:
+    """Test waiting for a notification stops when the device disconnects."""
+    disconnected = asyncio.Event()
+    response = BleNotificationResponse(disconnected)
+    asyncio.get_running_loop().call_soon(disconnected.set)
+    with pytest.raises(BleakError):
+        await response.next(timeout=1)
+
+
+async def test_timeout() -> None:
+    """Test waiting for a notification times out and leaves the queue usable."""
+    disconnected = asyncio.Event()
+    response = BleNotificationResponse(disconnected)
+    with pytest.raises(asyncio.TimeoutError):
+        await response.next(timeout=0.01)
+
+    response.notification_handler(None, bytearray(b"\x03"))
+    assert await response.next(timeout=1) == b"\x03"
+
+
+async def test_disconnect_with_queued_notification() -> None:
+    """Test a queued notification is still returned after a disconnect."""
+    disconnected = asyncio.Event()
+    response = BleNotificationResponse(disconnected)
+    response.notification_handler(None, bytearray(b"\x04"))
+    disconnected.set()
+    assert await response.next(timeout=1) == b"\x04"
+
+    with pytest.raises(BleakError):
+        await response.next(timeout=1)
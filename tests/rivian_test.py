@@ -3,6 +3,8 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
+import json
+
 import aiohttp
 import pytest
 from aresponses import ResponsesMockServer
@@ -174,6 +176,30 @@ async def test_get_vehicle_state(aresponses: ResponsesMockServer) -> None:
         await rivian.close()
 
 
+async def test_get_vehicle_state_subscription_only_properties(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test subscription only properties are dropped without mutating the input."""
+    queries: list[str] = []
+
+    async def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        queries.append((await request.json())["query"])
+        return aresponses.Response(
+            text=json.dumps(VEHICLE_STATE_RESPONSE), content_type="application/json"
+        )
+
+    aresponses.add("rivian.com", "/api/gql/gateway/graphql", "POST", response=handler)
+    properties = {"batteryLevel", "tirePressureFrontLeft"}
+    async with aiohttp.ClientSession():
+        rivian = Rivian(app_session_token="token", user_session_token="token")
+        response = await rivian.get_vehicle_state("vin", properties)
+        assert response.status == 200
+        assert properties == {"batteryLevel", "tirePressureFrontLeft"}
+        await rivian.close()
+    assert "batteryLevel" in queries[0]
+    assert "tirePressureFrontLeft" not in queries[0]
+
+
 async def test_get_live_charging_session(aresponses: ResponsesMockServer) -> None:
     """Test GraphQL Response for a getLiveSessionData request"""
     aresponses.add(
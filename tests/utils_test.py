@@ -31,3 +31,11 @@ def test_generate_vehicle_command_hmac() -> None:
         command, timestamp, VEHICLE_KEY, PRIVATE_KEY
     )
     assert hmac == "2a68bdda69ff8643e37bac595905f6a481435e00bb63bdd415ecbb425a5bb598"
+
+
+def test_decoded_keys_are_cached() -> None:
+    """Test decoded keys are reused across calls."""
+    assert utils.decode_private_key(PRIVATE_KEY) is utils.decode_private_key(
+        PRIVATE_KEY
+    )
+    assert utils.decode_public_key(VEHICLE_KEY) is utils.decode_public_key(VEHICLE_KEY)